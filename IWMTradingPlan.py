@@ -1,110 +1,318 @@
+import logging
+import threading
 import pandas as pd
 import numpy as np
-import yfinance as yf
-from datetime import datetime, timedelta
-import pandas_market_calendars as mcal
-import matplotlib.pyplot as plt
-from tabulate import tabulate
+from datetime import datetime
+from functools import lru_cache
+
+from iwm_cache import FileCache, get_history
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the interpreter
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Lazy %s formatting throughout: the logging module only stringifies the
+# arguments if a handler will actually emit the record.
+logger = logging.getLogger(__name__)
+
+_schedule_cache = FileCache()
+
+
+@lru_cache(maxsize=None)
+def _next_trading_days(today_iso, days):
+    """Upcoming trading dates, memoized in-process and persisted on disk
+    so Streamlit cold starts skip the calendar build for the day.
+
+    Business days minus US federal holidays approximate the NYSE calendar
+    closely enough for plan dates, and np.busday_offset runs at C speed
+    instead of materializing a pandas_market_calendars schedule frame.
+    """
+    key = f"trading_days_{today_iso}_{days}"
+    dates = _schedule_cache.get(key, 24 * 60 * 60)
+    if dates is None:
+        from pandas.tseries.holiday import USFederalHolidayCalendar
+
+        start = np.datetime64(today_iso, 'D')
+        end = start + np.timedelta64(400, 'D')
+        holidays = (USFederalHolidayCalendar()
+                    .holidays(start=today_iso, end=str(end))
+                    .values.astype('datetime64[D]'))
+        sessions = np.busday_offset(start, np.arange(days),
+                                    roll='forward', holidays=holidays)
+        dates = tuple(sessions.astype(str))
+        _schedule_cache.set(key, dates)
+    return dates
+
+@njit(cache=True)
+def _simulate_plan_kernel(start_balance, atr, gain_loss, risk_pct,
+                          contract_size, min_c, max_c):
+    """Roll the balance forward over one gain/loss path.
+
+    gain_loss holds per-contract dollar P&L per day; position size is
+    recomputed from the running balance and that day's ATR. A sequential
+    recurrence, so it is written as a plain loop for numba.
+    """
+    n = gain_loss.shape[0]
+    balances = np.empty(n)
+    bal = start_balance
+    for i in range(n):
+        contracts = int(bal * risk_pct / (atr[i] * contract_size))
+        if contracts < min_c:
+            contracts = min_c
+        elif contracts > max_c:
+            contracts = max_c
+        bal += gain_loss[i] * contracts
+        balances[i] = bal
+    return balances
+
+
+# Columnar journal layout: one record per trade, preallocated to the plan
+# length so recording a trade is a single slot write.
+_JOURNAL_DTYPE = np.dtype([
+    ('Date', 'U10'),
+    ('Day', 'i4'),
+    ('Direction', 'U4'),
+    ('Contracts', 'i4'),
+    ('Entry Price', 'f4'),
+    ('Exit Price', 'f4'),
+    ('Gain/Loss', 'f4'),
+    ('Ending Balance', 'f4'),
+    ('Starting Balance', 'f4'),
+])
+
 
 class IWMTradingPlan:
+    # Position sizing: risk RISK_PCT of the balance per trade against an
+    # ATR-scaled dollar risk per contract, clamped to a sane range.
+    RISK_PCT = 0.1
+    CONTRACT_MULTIPLIER = 100
+    MIN_CONTRACTS = 1
+    MAX_CONTRACTS = 100
+
     def __init__(self, start_balance=90, daily_return=0.10, days=100):
         self.start_balance = start_balance
         self.daily_return = daily_return
         self.days = days
-        self.trading_plan = None
         self.current_day = 0
-        self.trade_journal = []
+        self._journal = np.empty(days, dtype=_JOURNAL_DTYPE)
+        self._n_trades = 0
+        self._trading_days_cache = None
+        # Bumped on every mutation; external caches key on it to know when
+        # a cached view of the plan is stale.
+        self.version = 0
+        # One instance is shared across Streamlit sessions, so mutations
+        # are serialized.
+        self._lock = threading.Lock()
         self.initialize_plan()
 
+    @property
+    def trade_journal(self):
+        """Recorded trades as a structured-array view (no copies)."""
+        return self._journal[:self._n_trades]
+
+    @property
+    def trading_plan(self):
+        """The plan as a DataFrame, materialized lazily from the column
+        store and rebuilt only after a write invalidates it.
+
+        The string columns hold a handful of distinct values across the
+        whole plan, so they are encoded as Categoricals: pandas then
+        stores one copy of each string plus a small code array instead of
+        a pointer per row.
+        """
+        if self._trading_plan_df is None:
+            self._trading_plan_df = pd.DataFrame({
+                col: pd.Categorical(arr) if arr.dtype == object else arr
+                for col, arr in self._cols.items()
+            })
+        return self._trading_plan_df
+
     def initialize_plan(self):
         trading_days = self.get_next_trading_days()
-        ticker = yf.Ticker("IWM")
-        hist = ticker.history(period="6mo")
+        hist = get_history("IWM", "6mo")
+        self._hist = hist
         levels = self.calculate_technical_levels(hist)
+        self._levels = levels
+
+        # Levels are fixed at init time, so the direction/condition fields
+        # are loop-invariant; compute them once instead of per row.
+        condition = "Bullish" if levels['prev_close'] > levels['50ma'] else "Bearish"
+
+        if condition == "Bullish":
+            direction = "CALL"
+            threshold1, threshold2 = levels['r1'], levels['pivot']
+            profit_target = 25
+            entry_condition = f"Enter CALL if pre-market high > {threshold1:.2f} or opening range high > {threshold2:.2f}"
+        else:
+            direction = "PUT"
+            threshold1, threshold2 = levels['s1'], levels['pivot']
+            profit_target = 15
+            entry_condition = f"Enter PUT if pre-market low < {threshold1:.2f} or opening range low < {threshold2:.2f}"
+        stop_loss = 20
+        exit_condition = f"Exit at {profit_target}% profit or {stop_loss}% loss"
+
+        key_levels = f"Pivot: {levels['pivot']:.2f}, R1: {levels['r1']:.2f}, S1: {levels['s1']:.2f}"
+
+        # The plan itself is a dict of preallocated per-column arrays (SoA):
+        # scalar reads and writes are plain C-level ndarray accesses, and the
+        # DataFrame is only materialized on demand for display paths.
+        n = len(trading_days)
+
+        # Projected balance curve: each day's starting balance compounds the
+        # target daily return, and position size follows it. Recorded trades
+        # overwrite the projection with actual balances as they come in.
+        balances = (self.start_balance
+                    * (1 + self.daily_return) ** np.arange(n)).astype(np.float32)
+        risk_per_contract = levels['atr'] * self.CONTRACT_MULTIPLIER
+        contracts = np.clip((balances * self.RISK_PCT / risk_per_contract)
+                            .astype(np.int32),
+                            self.MIN_CONTRACTS, self.MAX_CONTRACTS)
+
+        # Sorted session dates kept as datetime64 for O(log n) date lookups.
+        self._dates_np = np.asarray(trading_days, dtype='datetime64[D]')
+
+        self._cols = {
+            'Date': np.asarray(trading_days),
+            'Day': np.arange(1, n + 1, dtype=np.int32),
+            'Starting Balance': balances,
+            'Direction': np.full(n, direction, dtype=object),
+            'Contracts': contracts,
+            'Entry Price': np.full(n, np.nan, dtype=np.float32),
+            'Exit Price': np.full(n, np.nan, dtype=np.float32),
+            'Gain/Loss': np.full(n, np.nan, dtype=np.float32),
+            'Ending Balance': np.full(n, np.nan, dtype=np.float32),
+            'Market Condition': np.full(n, condition, dtype=object),
+            'Pivot': np.full(n, levels['pivot'], dtype=np.float32),
+            'R1': np.full(n, levels['r1'], dtype=np.float32),
+            'S1': np.full(n, levels['s1'], dtype=np.float32),
+            'Threshold 1': np.full(n, threshold1, dtype=np.float32),
+            'Threshold 2': np.full(n, threshold2, dtype=np.float32),
+            'Profit Target': np.full(n, profit_target, dtype=np.int32),
+            'Stop Loss': np.full(n, stop_loss, dtype=np.int32),
+            'Key Levels': np.full(n, key_levels, dtype=object),
+            'Entry Condition': np.full(n, entry_condition, dtype=object),
+            'Exit Condition': np.full(n, exit_condition, dtype=object),
+        }
+        self._trading_plan_df = None
 
-        plan_data = []
-        current_balance = self.start_balance
-
-        for i, date in enumerate(trading_days):
-            contracts = max(1, int(current_balance * 0.1 / 10))
-            condition = "Bullish" if levels['prev_close'] > levels['50ma'] else "Bearish"
-
-            if condition == "Bullish":
-                direction = "CALL"
-                entry_condition = f"Enter CALL if pre-market high > {levels['r1']:.2f} or opening range high > {levels['pivot']:.2f}"
-                exit_condition = "Exit at 25% profit or 20% loss"
-            else:
-                direction = "PUT"
-                entry_condition = f"Enter PUT if pre-market low < {levels['s1']:.2f} or opening range low < {levels['pivot']:.2f}"
-                exit_condition = "Exit at 15% profit or 20% loss"
-
-            plan_data.append([
-                date, i + 1, current_balance, direction, contracts,
-                None, None, None, None, condition,
-                f"Pivot: {levels['pivot']:.2f}, R1: {levels['r1']:.2f}, S1: {levels['s1']:.2f}",
-                entry_condition, exit_condition
-            ])
-
-        columns = [
-            'Date', 'Day', 'Starting Balance', 'Direction', 'Contracts',
-            'Entry Price', 'Exit Price', 'Gain/Loss', 'Ending Balance',
-            'Market Condition', 'Key Levels', 'Entry Condition', 'Exit Condition'
-        ]
-        self.trading_plan = pd.DataFrame(plan_data, columns=columns)
+        # Per-day plan dicts (with their formatted display strings) are
+        # cached here; Streamlit reruns re-read them far more often than
+        # updates invalidate them.
+        self._day_plan_cache = {}
 
     def get_next_trading_days(self):
-        nyse = mcal.get_calendar('NYSE')
-        start_date = datetime.now()
-        end_date = start_date + timedelta(days=200)
-        schedule = nyse.schedule(start_date=start_date, end_date=end_date)
-        return schedule.index[:self.days].strftime('%Y-%m-%d').tolist()
+        # One-shot attribute cache: repeat calls on an instance skip the
+        # date formatting and lru_cache lock/hash entirely.
+        if self._trading_days_cache is None:
+            self._trading_days_cache = list(
+                _next_trading_days(datetime.now().date().isoformat(), self.days))
+        return self._trading_days_cache
+
+    def calculate_position_size(self, balance, atr):
+        """Contracts to trade for a balance given the current ATR.
+
+        Validates inputs once at this public entry point; hot paths that
+        already hold validated values call _position_size_unchecked.
+        """
+        if balance <= 0 or atr <= 0:
+            raise ValueError("balance and atr must be positive")
+        return self._position_size_unchecked(balance, atr)
+
+    def _position_size_unchecked(self, balance, atr):
+        contracts = int(balance * self.RISK_PCT / (atr * self.CONTRACT_MULTIPLIER))
+        return min(max(contracts, self.MIN_CONTRACTS), self.MAX_CONTRACTS)
+
+    def simulate_scenarios(self, gain_loss_matrix, atr=None):
+        """What-if analysis: balance curves for per-contract P&L paths.
+
+        gain_loss_matrix is (paths, days) of per-contract dollar P&L; a
+        single path may be passed as a 1-D array. Returns the matching
+        (paths, days) array of balances after each day.
+        """
+        gain_loss = np.atleast_2d(np.asarray(gain_loss_matrix, dtype=np.float64))
+        if atr is None:
+            atr = self._levels['atr']
+        atr_path = np.full(gain_loss.shape[1], atr, dtype=np.float64)
+
+        return np.stack([
+            _simulate_plan_kernel(float(self.start_balance), atr_path, path,
+                                  self.RISK_PCT, float(self.CONTRACT_MULTIPLIER),
+                                  self.MIN_CONTRACTS, self.MAX_CONTRACTS)
+            for path in gain_loss
+        ])
 
     def calculate_technical_levels(self, data):
-        return {
-            'prev_close': data['Close'].iloc[-1],
-            'pivot': (data['High'].iloc[-1] + data['Low'].iloc[-1] + data['Close'].iloc[-1]) / 3,
-            'r1': 2 * ((data['High'].iloc[-1] + data['Low'].iloc[-1] + data['Close'].iloc[-1]) / 3) - data['Low'].iloc[-1],
-            's1': 2 * ((data['High'].iloc[-1] + data['Low'].iloc[-1] + data['Close'].iloc[-1]) / 3) - data['High'].iloc[-1],
-            '20ma': data['Close'].rolling(window=20).mean().iloc[-1],
-            '50ma': data['Close'].rolling(window=50).mean().iloc[-1],
-            'atr': (data['High'] - data['Low']).rolling(14).mean().iloc[-1]
+        # Work on the raw arrays: the rolling means above only ever needed
+        # their last value, so computing tail-window means directly avoids
+        # materializing full rolling Series and repeated pandas indexing.
+        high = data['High'].to_numpy()
+        low = data['Low'].to_numpy()
+        close = data['Close'].to_numpy()
+
+        pivot = (high[-1] + low[-1] + close[-1]) / 3
+        levels = {
+            'prev_close': float(close[-1]),
+            'pivot': float(pivot),
+            'r1': float(2 * pivot - low[-1]),
+            's1': float(2 * pivot - high[-1]),
+            '20ma': float(close[-20:].mean()),
+            '50ma': float(close[-50:].mean()),
+            'atr': float((high[-14:] - low[-14:]).mean())
         }
+        logger.debug("Calculated technical levels: %s", levels)
+        return levels
 
     def record_trade(self, day, entry_price, exit_price):
         if day < 1 or day > self.days:
             print(f"Invalid day. Must be between 1 and {self.days}")
             return
 
-        trade_day = self.trading_plan.iloc[day - 1]
-        contracts = trade_day['Contracts']
-        price_diff = exit_price - entry_price
-        gain_loss = price_diff * 100 * contracts
-        ending_balance = trade_day['Starting Balance'] + gain_loss
+        with self._lock:
+            idx = day - 1
+            cols = self._cols
+            contracts = int(cols['Contracts'][idx])
+            starting_balance = float(cols['Starting Balance'][idx])
+            price_diff = exit_price - entry_price
+            gain_loss = price_diff * self.CONTRACT_MULTIPLIER * contracts
+            ending_balance = starting_balance + gain_loss
 
-        trade_record = {
-            'Date': trade_day['Date'],
-            'Day': trade_day['Day'],
-            'Direction': trade_day['Direction'],
-            'Contracts': contracts,
-            'Entry Price': entry_price,
-            'Exit Price': exit_price,
-            'Gain/Loss': gain_loss,
-            'Ending Balance': ending_balance,
-            'Starting Balance': trade_day['Starting Balance']
-        }
-        self.trade_journal.append(trade_record)
+            # Re-recording a day appends a fresh slot, so the journal can
+            # outgrow its initial self.days capacity; double it when full.
+            if self._n_trades == len(self._journal):
+                grown = np.empty(len(self._journal) * 2, dtype=_JOURNAL_DTYPE)
+                grown[:self._n_trades] = self._journal
+                self._journal = grown
 
-        self.trading_plan.at[day - 1, 'Entry Price'] = entry_price
-        self.trading_plan.at[day - 1, 'Exit Price'] = exit_price
-        self.trading_plan.at[day - 1, 'Gain/Loss'] = gain_loss
-        self.trading_plan.at[day - 1, 'Ending Balance'] = ending_balance
+            self._journal[self._n_trades] = (
+                cols['Date'][idx], cols['Day'][idx], cols['Direction'][idx],
+                contracts, entry_price, exit_price, gain_loss, ending_balance,
+                starting_balance)
+            self._n_trades += 1
 
-        if day < self.days:
-            self.trading_plan.at[day, 'Starting Balance'] = ending_balance
+            cols['Entry Price'][idx] = entry_price
+            cols['Exit Price'][idx] = exit_price
+            cols['Gain/Loss'][idx] = gain_loss
+            cols['Ending Balance'][idx] = ending_balance
 
+            if day < self.days:
+                cols['Starting Balance'][day] = ending_balance
+
+            # The recorded day and the next day's carried balance changed.
+            self._trading_plan_df = None
+            self._day_plan_cache.pop(day, None)
+            self._day_plan_cache.pop(day + 1, None)
+            self.version += 1
+            self.current_day = day
+
+        logger.debug("Trade recorded: day=%s contracts=%s gain_loss=%.2f "
+                     "ending_balance=%.2f", day, contracts, gain_loss,
+                     ending_balance)
         print(f"Trade recorded for Day {day}:")
         print(f"Gain/Loss: ${gain_loss:.2f} | New Balance: ${ending_balance:.2f}")
-        self.current_day = day
 
     def get_daily_plan(self, day=None):
         if day is None:
@@ -114,11 +322,32 @@ class IWMTradingPlan:
             print(f"Invalid day. Must be between 1 and {self.days}")
             return None
 
-        # Return as dictionary for easier access in Streamlit
-        return self.trading_plan.iloc[day - 1].to_dict()
+        # Return as dictionary for easier access in Streamlit; cached so
+        # reruns skip rebuilding it, and read straight from the column store.
+        if day not in self._day_plan_cache:
+            self._day_plan_cache[day] = self._day_dict(day)
+        return self._day_plan_cache[day]
+
+    def _day_dict(self, day):
+        idx = day - 1
+        return {col: arr[idx] for col, arr in self._cols.items()}
+
+    def day_index(self, date):
+        """1-based plan day for a calendar date.
+
+        Binary search on the sorted session dates; a non-session date maps
+        to the next session.
+        """
+        return int(np.searchsorted(self._dates_np, np.datetime64(date))) + 1
+
+    def record_trade_by_date(self, date, entry_price, exit_price):
+        """record_trade overload that looks the plan day up from a date."""
+        self.record_trade(self.day_index(date), entry_price, exit_price)
         
-    def update_daily_plan(self, starting_balance, market_condition, direction, 
-                      contracts, key_levels, entry_condition, exit_condition):
+    def update_daily_plan(self, starting_balance, market_condition, direction,
+                      contracts, key_levels, entry_condition, exit_condition,
+                      pivot=None, r1=None, s1=None, threshold1=None,
+                      threshold2=None, profit_target=None, stop_loss=None):
         """Update today's trading plan with new values"""
         day = self.current_day + 1
         
@@ -126,23 +355,43 @@ class IWMTradingPlan:
             print(f"Invalid day. Must be between 1 and {self.days}")
             return
         
-        # Update all editable fields
-        self.trading_plan.at[day - 1, 'Starting Balance'] = starting_balance
-        self.trading_plan.at[day - 1, 'Market Condition'] = market_condition
-        self.trading_plan.at[day - 1, 'Direction'] = direction
-        self.trading_plan.at[day - 1, 'Contracts'] = contracts
-        self.trading_plan.at[day - 1, 'Key Levels'] = key_levels
-        self.trading_plan.at[day - 1, 'Entry Condition'] = entry_condition
-        self.trading_plan.at[day - 1, 'Exit Condition'] = exit_condition
-        
+        # Update all editable fields; the numeric columns stay in sync with
+        # their display strings. Each write is a scalar ndarray store.
+        updates = {
+            'Starting Balance': starting_balance,
+            'Market Condition': market_condition,
+            'Direction': direction,
+            'Contracts': contracts,
+            'Key Levels': key_levels,
+            'Entry Condition': entry_condition,
+            'Exit Condition': exit_condition,
+            'Pivot': pivot, 'R1': r1, 'S1': s1,
+            'Threshold 1': threshold1, 'Threshold 2': threshold2,
+            'Profit Target': profit_target, 'Stop Loss': stop_loss,
+        }
+        idx = day - 1
+        with self._lock:
+            for col, value in updates.items():
+                if value is not None:
+                    self._cols[col][idx] = value
+
+            # Refresh the cached day dict eagerly so the next rerun is a hit.
+            self._trading_plan_df = None
+            self._day_plan_cache[day] = self._day_dict(day)
+            self.version += 1
+
         print(f"Plan updated for Day {day}")
 
     def get_market_analysis(self):
-        ticker = yf.Ticker("IWM")
-        hist = ticker.history(period="1mo")
+        # One shared 6mo fetch serves both plan construction and analysis:
+        # the default TTL here matches initialize_plan's, so a warm entry is
+        # reused and sliced in-memory to the last month of sessions rather
+        # than issuing a second, narrower request. Intraday freshness comes
+        # from refresh(), not a shorter TTL on this path.
+        self._hist = get_history("IWM", "6mo")
+        hist = self._hist.tail(22)
         levels = self.calculate_technical_levels(hist)
-        current_data = ticker.history(period="1d")
-        current_price = current_data['Close'].iloc[-1]
+        current_price = hist['Close'].iloc[-1]
         condition = "Bullish" if current_price > levels['50ma'] else "Bearish"
 
         return {
@@ -152,13 +401,26 @@ class IWMTradingPlan:
             'Recommendation': "BUY CALLS" if condition == "Bullish" else "BUY PUTS"
         }
 
+    def refresh(self):
+        """Force-refetch the shared history and recompute the plan levels.
+
+        Wired to the app's Refresh Market Data button. The forced fetch
+        overwrites the shared cache entry, so the next get_market_analysis()
+        call picks up the fresh frame instead of discarding it.
+        """
+        self._hist = get_history("IWM", "6mo", ttl=0)
+        self._levels = self.calculate_technical_levels(self._hist)
+
     def plot_performance(self):
-        if not self.trade_journal:
+        if self._n_trades == 0:
             print("No trades recorded yet")
             return
 
-        days = [t['Day'] for t in self.trade_journal]
-        balances = [t['Ending Balance'] for t in self.trade_journal]
+        import matplotlib.pyplot as plt
+
+        journal = self.trade_journal
+        days = journal['Day']
+        balances = journal['Ending Balance']
 
         plt.figure(figsize=(12, 6))
         plt.plot(days, balances, marker='o', linestyle='-', color='b')
@@ -171,18 +433,22 @@ class IWMTradingPlan:
         plt.show()
 
     def show_summary(self):
-        if not self.trade_journal:
+        if self._n_trades == 0:
             print("No trades recorded yet")
             return
 
-        start_balance = self.trade_journal[0]['Starting Balance']
-        current_balance = self.trade_journal[-1]['Ending Balance']
+        journal = self.trade_journal
+        start_balance = journal['Starting Balance'][0]
+        current_balance = journal['Ending Balance'][-1]
         total_gain = current_balance - start_balance
         growth_percent = (total_gain / start_balance) * 100
 
-        wins = sum(1 for t in self.trade_journal if t['Gain/Loss'] > 0)
-        losses = sum(1 for t in self.trade_journal if t['Gain/Loss'] < 0)
-        win_rate = (wins / len(self.trade_journal)) * 100
+        # The journal is already columnar, so the metrics are plain
+        # vectorized reductions.
+        gains = journal['Gain/Loss']
+        wins = int((gains > 0).sum())
+        losses = int((gains < 0).sum())
+        win_rate = (wins / self._n_trades) * 100
 
         print("\n" + "=" * 50)
         print("TRADING PERFORMANCE SUMMARY")
@@ -190,15 +456,15 @@ class IWMTradingPlan:
         print(f"Starting Balance: ${start_balance:.2f}")
         print(f"Current Balance: ${current_balance:.2f}")
         print(f"Total Gain/Loss: ${total_gain:.2f} ({growth_percent:.2f}%)")
-        print(f"Trades Completed: {len(self.trade_journal)}")
+        print(f"Trades Completed: {self._n_trades}")
         print(f"Win Rate: {win_rate:.2f}% ({wins} wins, {losses} losses)")
         print("=" * 50)
 
-        if len(self.trade_journal) > 0:
-            print("\nLAST 5 TRADES:")
-            recent_trades = self.trade_journal[-5:] if len(self.trade_journal) > 5 else self.trade_journal
-            print(tabulate(
-                pd.DataFrame(recent_trades)[['Date', 'Day', 'Direction', 'Contracts',
-                                             'Entry Price', 'Exit Price', 'Gain/Loss']],
-                headers='keys', tablefmt='psql', showindex=False
-            ))
+        from tabulate import tabulate
+
+        print("\nLAST 5 TRADES:")
+        cols = ['Date', 'Day', 'Direction', 'Contracts',
+                'Entry Price', 'Exit Price', 'Gain/Loss']
+        recent_trades = journal[-5:][cols]
+        print(tabulate([tuple(row) for row in recent_trades],
+                       headers=cols, tablefmt='psql'))
@@ -0,0 +1,81 @@
+import os
+import pickle
+import time
+from datetime import date
+from functools import lru_cache
+
+# Where cached market data lives. Safe to delete at any time.
+CACHE_DIR = ".cache"
+
+# TTL in seconds per yfinance period. Daily-bar histories only change once
+# per session, so a day is fine; intraday data goes stale quickly.
+_TTLS = {"1d": 60}
+_DEFAULT_TTL = 24 * 60 * 60
+
+
+class FileCache:
+    """Tiny TTL cache that persists DataFrames under CACHE_DIR.
+
+    Entries are pickles of {'ts': <epoch seconds>, 'data': <DataFrame>} so a
+    Streamlit cold start can reuse data fetched by a previous process.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key, ttl):
+        try:
+            with open(self._path(key), "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if time.time() - entry["ts"] > ttl:
+            return None
+        return entry["data"]
+
+    def set(self, key, data):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._path(key), "wb") as f:
+            pickle.dump({"ts": time.time(), "data": data}, f)
+
+
+_file_cache = FileCache()
+
+
+def get_history(symbol, period, ttl=None):
+    """Fetch `yf.Ticker(symbol).history(period=period)` through the caches.
+
+    Warm calls skip the blocking HTTPS round-trip entirely: first the
+    in-process memo, then the on-disk cache, then the network. `ttl`
+    overrides the per-period default for callers that need fresher data.
+    """
+    if ttl is None:
+        ttl = _TTLS.get(period, _DEFAULT_TTL)
+    if ttl <= 0:
+        # Force-refresh: drop the in-process memo so every caller sees the
+        # refetched frame, and use a unique bucket to bypass the file cache.
+        _memoized_history.cache_clear()
+        bucket = time.time()
+    elif ttl >= _DEFAULT_TTL:
+        bucket = date.today().isoformat()
+    else:
+        bucket = int(time.time() // ttl)
+    return _memoized_history(symbol, period, ttl, bucket)
+
+
+@lru_cache(maxsize=8)
+def _memoized_history(symbol, period, ttl, bucket):
+    # One file entry per (symbol, period): a forced refetch overwrites it,
+    # so callers with longer TTLs pick up the fresher data too. The bucket
+    # only scopes the in-process memo above.
+    key = f"{symbol}_{period}"
+    hist = _file_cache.get(key, ttl)
+    if hist is None:
+        import yfinance as yf
+
+        hist = yf.Ticker(symbol).history(period=period)
+        _file_cache.set(key, hist)
+    return hist
@@ -1,142 +1,192 @@
+import logging
+from logging.handlers import RotatingFileHandler
+
 import streamlit as st
 from IWMTradingPlan import IWMTradingPlan
 import pandas as pd
-import matplotlib.pyplot as plt
-import re
+
+# Configure logging once per process: Streamlit re-executes this module on
+# every rerun, and an unguarded setup would stack handlers and leak file
+# descriptors. RotatingFileHandler bounds disk usage.
+_root_logger = logging.getLogger()
+if not _root_logger.handlers:
+    _handler = RotatingFileHandler("trading_app.log",
+                                   maxBytes=1_000_000, backupCount=3)
+    _handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    _root_logger.addHandler(_handler)
+    _root_logger.setLevel(logging.INFO)
+
+logger = logging.getLogger(__name__)
 
 st.set_page_config(page_title="IWM 0DTE Trading App", layout="centered")
 st.title("📈 IWM 0DTE Trading Plan & Tracker")
 
+@st.cache_resource(ttl=3600)
+def _get_plan():
+    """Build the plan once per process (and per hour) instead of per session."""
+    return IWMTradingPlan()
+
+
 # Initialize session state
 if 'plan' not in st.session_state:
-    st.session_state.plan = IWMTradingPlan()
+    st.session_state.plan = _get_plan()
 
 plan = st.session_state.plan
 
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _market_analysis():
+    """Market analysis memoized so rerun storms coalesce.
+
+    The TTL matches the history layer's day-level caching in spirit: it
+    only bounds recompute churn. Genuinely fresh data comes from the
+    refresh button, which refetches and then clears this cache.
+    """
+    return st.session_state.plan.get_market_analysis()
+
+
+@st.cache_data(ttl=60)
+def _cached_daily_plan(plan_id, version):
+    """Today's plan dict, keyed by the plan's version counter so edits
+    and recorded trades invalidate it immediately.
+
+    `plan_id` disambiguates instances: version counters restart at 0 when
+    the hourly cache_resource rollover builds a fresh plan, and cache_data
+    is process-global, so version alone could alias across instances.
+    """
+    return st.session_state.plan.get_daily_plan()
+
+
+@st.cache_data
+def _journal_df(plan_id, n_trades):
+    """Journal as a DataFrame, rebuilt only when a trade is recorded.
+
+    The journal is append-only, so its length plus `plan_id` is a
+    sufficient cache key; length alone would alias across plan instances
+    after an hourly cache_resource rollover and serve another instance's
+    trades indefinitely.
+    """
+    return pd.DataFrame(st.session_state.plan.trade_journal)
+
+
+# Columns shown in the recent-trades table, built once at import
+_SUMMARY_COLS = ['Date', 'Day', 'Direction', 'Contracts',
+                 'Entry Price', 'Exit Price', 'Gain/Loss', 'Ending Balance']
+
+def _plan_strings(direction, pivot, r1, s1, threshold1, threshold2, profit_target, stop_loss):
+    """Build the human-readable sentences stored in the plan columns."""
+    levels = f"Pivot: {pivot:.2f}, R1: {r1:.2f}, S1: {s1:.2f}"
+    if direction == "CALL":
+        entry = f"Enter CALL if pre-market high > {threshold1:.2f} or opening range high > {threshold2:.2f}"
+    else:
+        entry = f"Enter PUT if pre-market low < {threshold1:.2f} or opening range low < {threshold2:.2f}"
+    exit_ = f"Exit at {profit_target}% profit or {stop_loss}% loss"
+    return levels, entry, exit_
+
+
 # Sidebar navigation
 page = st.sidebar.radio("Go to", ["📅 Today's Plan", "🧮 Record a Trade", "📊 Performance Summary"])
 
-if page == "📅 Today's Plan":
-    st.header("📅 Today's Trading Plan")
-    day_plan = plan.get_daily_plan()
-    
-    # Use columns for better layout
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.write(f"**Date:** {day_plan['Date']}")
-        
-        # Editable starting balance
-        starting_balance = st.number_input(
-            "**Starting Balance ($)**", 
-            value=float(day_plan['Starting Balance']),
-            step=1.0,
-            format="%.2f"
-        )
-        
-        # Editable market condition
-        market_condition = st.selectbox(
-            "**Market Condition**", 
-            ["Bullish", "Bearish"], 
-            index=0 if day_plan['Market Condition'] == "Bullish" else 1
-        )
-        
-        # Editable direction
-        direction = st.selectbox(
-            "**Direction**", 
-            ["CALL", "PUT"], 
-            index=0 if day_plan['Direction'] == "CALL" else 1
-        )
-        
-        # Editable contracts
-        contracts = st.number_input(
-            "**Contracts**", 
-            value=int(day_plan['Contracts']), 
-            min_value=1, 
-            step=1
+@st.fragment
+def _today_plan_editor(plan):
+    """Editable plan form. Scoped rerun: submitting only re-renders this."""
+    day_plan = _cached_daily_plan(id(plan), plan.version)
+
+    # Batch all edits into one rerun: nothing reruns until submit
+    with st.form("today_plan_form"):
+        # Use columns for better layout
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write(f"**Date:** {day_plan['Date']}")
+
+            # Editable starting balance
+            starting_balance = st.number_input(
+                "**Starting Balance ($)**",
+                value=float(day_plan['Starting Balance']),
+                step=1.0,
+                format="%.2f"
+            )
+
+            # Editable market condition
+            market_condition = st.selectbox(
+                "**Market Condition**",
+                ["Bullish", "Bearish"],
+                index=0 if day_plan['Market Condition'] == "Bullish" else 1
+            )
+
+            # Editable direction
+            direction = st.selectbox(
+                "**Direction**",
+                ["CALL", "PUT"],
+                index=0 if day_plan['Direction'] == "CALL" else 1
+            )
+
+            # Editable contracts
+            contracts = st.number_input(
+                "**Contracts**",
+                value=int(day_plan['Contracts']),
+                min_value=1,
+                step=1
+            )
+
+        with col2:
+            # Editable key levels, read straight from the numeric columns
+            st.write("**Key Levels**")
+            pivot = st.number_input("Pivot", value=float(day_plan['Pivot']), step=0.01, format="%.2f")
+            r1 = st.number_input("R1", value=float(day_plan['R1']), step=0.01, format="%.2f")
+            s1 = st.number_input("S1", value=float(day_plan['S1']), step=0.01, format="%.2f")
+
+        # Editable entry condition thresholds, read from the numeric columns
+        st.write("**Entry Condition**")
+        col3, col4 = st.columns(2)
+        with col3:
+            new_threshold1 = st.number_input("Threshold 1", value=float(day_plan['Threshold 1']), step=0.01, format="%.2f")
+        with col4:
+            new_threshold2 = st.number_input("Threshold 2", value=float(day_plan['Threshold 2']), step=0.01, format="%.2f")
+
+        # Editable exit condition percentages, read from the numeric columns
+        st.write("**Exit Condition**")
+        col5, col6 = st.columns(2)
+        with col5:
+            new_profit_target = st.number_input("Profit Target (%)", value=int(day_plan['Profit Target']), min_value=1, max_value=100, step=1)
+        with col6:
+            new_stop_loss = st.number_input("Stop Loss (%)", value=int(day_plan['Stop Loss']), min_value=1, max_value=100, step=1)
+
+        submitted = st.form_submit_button("💾 Update Today's Plan")
+
+    if submitted:
+        # Sentences are only built on the write path, once per update
+        updated_levels, updated_entry, updated_exit = _plan_strings(
+            direction, pivot, r1, s1,
+            new_threshold1, new_threshold2,
+            new_profit_target, new_stop_loss
         )
-    
-    with col2:
-        # Editable key levels
-        st.write("**Key Levels**")
-        # Parse the key levels string
-        levels_str = day_plan['Key Levels']
-        # Extract numbers using regex
-        numbers = re.findall(r"[-+]?\d*\.\d+|\d+", levels_str)
-        if len(numbers) >= 3:
-            pivot = float(numbers[0])
-            r1 = float(numbers[1])
-            s1 = float(numbers[2])
+        try:
+            plan.update_daily_plan(
+                starting_balance=starting_balance,
+                market_condition=market_condition,
+                direction=direction,
+                contracts=contracts,
+                key_levels=updated_levels,
+                entry_condition=updated_entry,
+                exit_condition=updated_exit,
+                pivot=pivot,
+                r1=r1,
+                s1=s1,
+                threshold1=new_threshold1,
+                threshold2=new_threshold2,
+                profit_target=new_profit_target,
+                stop_loss=new_stop_loss
+            )
+        except (ValueError, IndexError):
+            logger.exception("Failed to update plan for day %s", day_plan['Day'])
+            st.error("Could not update the plan. See trading_app.log for details.")
         else:
-            # Default values if parsing fails
-            pivot = 0.0
-            r1 = 0.0
-            s1 = 0.0
-            
-        pivot = st.number_input("Pivot", value=pivot, step=0.01, format="%.2f")
-        r1 = st.number_input("R1", value=r1, step=0.01, format="%.2f")
-        s1 = st.number_input("S1", value=s1, step=0.01, format="%.2f")
-        
-        # Save updated levels
-        updated_levels = f"Pivot: {pivot:.2f}, R1: {r1:.2f}, S1: {s1:.2f}"
-    
-    # Editable entry condition
-    entry_condition = day_plan['Entry Condition']
-    # Extract numbers using regex
-    numbers = re.findall(r"[-+]?\d*\.\d+|\d+", entry_condition)
-    if len(numbers) >= 2:
-        threshold1 = float(numbers[0])
-        threshold2 = float(numbers[1])
-    else:
-        threshold1 = 0.0
-        threshold2 = 0.0
-    
-    st.write("**Entry Condition**")
-    col3, col4 = st.columns(2)
-    with col3:
-        new_threshold1 = st.number_input("Threshold 1", value=threshold1, step=0.01, format="%.2f")
-    with col4:
-        new_threshold2 = st.number_input("Threshold 2", value=threshold2, step=0.01, format="%.2f")
+            st.success("Plan updated successfully!")
     
-    if direction == "CALL":
-        updated_entry = f"Enter CALL if pre-market high > {new_threshold1:.2f} or opening range high > {new_threshold2:.2f}"
-    else:
-        updated_entry = f"Enter PUT if pre-market low < {new_threshold1:.2f} or opening range low < {new_threshold2:.2f}"
-    
-    # Editable exit condition
-    exit_condition = day_plan['Exit Condition']
-    # Extract numbers (integers for percentages)
-    numbers = re.findall(r"\d+", exit_condition)
-    if len(numbers) >= 2:
-        profit_target = int(numbers[0])
-        stop_loss = int(numbers[1])
-    else:
-        profit_target = 25
-        stop_loss = 20
-    
-    st.write("**Exit Condition**")
-    col5, col6 = st.columns(2)
-    with col5:
-        new_profit_target = st.number_input("Profit Target (%)", value=profit_target, min_value=1, max_value=100, step=1)
-    with col6:
-        new_stop_loss = st.number_input("Stop Loss (%)", value=stop_loss, min_value=1, max_value=100, step=1)
-    
-    updated_exit = f"Exit at {new_profit_target}% profit or {new_stop_loss}% loss"
-    
-    # Update plan button
-    if st.button("💾 Update Today's Plan"):
-        plan.update_daily_plan(
-            starting_balance=starting_balance,
-            market_condition=market_condition,
-            direction=direction,
-            contracts=contracts,
-            key_levels=updated_levels,
-            entry_condition=updated_entry,
-            exit_condition=updated_exit
-        )
-        st.success("Plan updated successfully!")
-    
-    # Display updated plan
+    # Display updated plan from the raw widget values
     st.divider()
     st.subheader("Current Plan")
     st.write(f"**Date:** {day_plan['Date']}")
@@ -144,12 +194,36 @@ if page == "📅 Today's Plan":
     st.write(f"**Market Condition:** {market_condition}")
     st.write(f"**Direction:** {direction}")
     st.write(f"**Contracts:** {contracts}")
-    st.write(f"**Key Levels:** {updated_levels}")
-    st.write(f"**Entry Condition:** {updated_entry}")
-    st.write(f"**Exit Condition:** {updated_exit}")
+    col_p, col_r, col_s = st.columns(3)
+    col_p.metric("Pivot", pivot)
+    col_r.metric("R1", r1)
+    col_s.metric("S1", s1)
+    st.write("**Entry thresholds:**", new_threshold1, "/", new_threshold2)
+    st.write("**Exit:**", new_profit_target, "% profit /", new_stop_loss, "% loss")
+
 
-    if st.button("🔍 Show Current Market Analysis"):
-        market = plan.get_market_analysis()
+@st.fragment
+def _market_analysis_section():
+    """Market analysis viewer. Refreshing here leaves the editor alone."""
+    col_show, col_refresh = st.columns(2)
+    with col_show:
+        show_market = st.button("🔍 Show Current Market Analysis")
+    with col_refresh:
+        # Manual escape hatch: refetch the history, then drop the memoized
+        # analysis built on the stale frame
+        if st.button("🔄 Refresh Market Data"):
+            st.session_state.plan.refresh()
+            _market_analysis.clear()
+
+    if show_market:
+        try:
+            market = _market_analysis()
+        except Exception:
+            # yfinance raises a grab-bag of network errors; keep the
+            # handler around the fetch only, not the rendering below
+            logger.exception("Market analysis fetch failed")
+            st.error("Could not fetch market data. See trading_app.log for details.")
+            return
         st.subheader("📈 Current Market Analysis")
         st.write(f"**IWM Price:** ${market['Current Price']:.2f}")
         st.write(f"**Market Condition:** {market['Market Condition']}")
@@ -157,6 +231,12 @@ if page == "📅 Today's Plan":
         for k, v in market['Key Levels'].items():
             st.write(f"**{k}:** {v:.2f}")
 
+
+if page == "📅 Today's Plan":
+    st.header("📅 Today's Trading Plan")
+    _today_plan_editor(plan)
+    _market_analysis_section()
+
 elif page == "🧮 Record a Trade":
     st.header("🧮 Record Trade")
 
@@ -165,16 +245,20 @@ elif page == "🧮 Record a Trade":
     exit_price = st.number_input("Exit Price", format="%.2f")
 
     if st.button("💾 Record Trade"):
-        plan.record_trade(trade_day, entry_price, exit_price)
+        try:
+            plan.record_trade(trade_day, entry_price, exit_price)
+        except (ValueError, IndexError):
+            logger.exception("Failed to record trade for day %s", trade_day)
+            st.error("Could not record the trade. See trading_app.log for details.")
 
 elif page == "📊 Performance Summary":
     st.header("📊 Performance Summary")
 
-    if not plan.trade_journal:
+    if len(plan.trade_journal) == 0:
         st.warning("No trades recorded yet.")
     else:
         # Create a summary from trade journal
-        trades = pd.DataFrame(plan.trade_journal)
+        trades = _journal_df(id(plan), len(plan.trade_journal))
         
         # Calculate performance metrics
         start_balance = trades.iloc[0]['Starting Balance']
@@ -182,8 +266,9 @@ elif page == "📊 Performance Summary":
         total_gain = current_balance - start_balance
         growth_percent = (total_gain / start_balance) * 100
         
-        wins = sum(trades['Gain/Loss'] > 0)
-        losses = sum(trades['Gain/Loss'] < 0)
+        gl = trades['Gain/Loss'].to_numpy()
+        wins = int((gl > 0).sum())
+        losses = int((gl < 0).sum())
         win_rate = (wins / len(trades)) * 100
         
         # Display summary
@@ -196,15 +281,8 @@ elif page == "📊 Performance Summary":
         
         # Display recent trades
         st.subheader("Recent Trades")
-        st.dataframe(trades.tail(5)[['Date', 'Day', 'Direction', 'Contracts', 
-                                    'Entry Price', 'Exit Price', 'Gain/Loss', 'Ending Balance']])
+        st.dataframe(trades.tail(5)[_SUMMARY_COLS], use_container_width=True)
         
-        # Plot balance curve
+        # Plot balance curve client-side; no matplotlib figure build needed
         st.subheader("💰 Balance Curve")
-        fig, ax = plt.subplots()
-        ax.plot(trades["Day"], trades["Ending Balance"], marker='o')
-        ax.set_xlabel("Day")
-        ax.set_ylabel("Account Balance ($)")
-        ax.set_title("Account Growth Over Time")
-        ax.grid(True)
-        st.pyplot(fig)
+        st.line_chart(trades.set_index("Day")["Ending Balance"])